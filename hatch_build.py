@@ -0,0 +1,70 @@
+"""
+Hatch build hook that compiles the optional ``_fingerprint`` C extension.
+
+The extension only accelerates :mod:`curseforge_dl.fingerprint`; when it
+cannot be built (no compiler available) the wheel falls back to pure Python.
+Set ``CURSEFORGE_DL_REQUIRE_EXT=1`` to turn a failed build into an error
+(used when building release wheels).
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+EXT_NAME = "curseforge_dl._fingerprint"
+EXT_SOURCE = "src/curseforge_dl/_fingerprint.c"
+
+
+def _build_extension(root: Path, build_dir: Path) -> Path:
+    """Compile the extension into ``build_dir`` and return the built file."""
+    from setuptools import Distribution, Extension
+    from setuptools.command.build_ext import build_ext
+
+    dist = Distribution(
+        {
+            "name": "curseforge-dl",
+            "ext_modules": [Extension(EXT_NAME, [str(root / EXT_SOURCE)])],
+        }
+    )
+    cmd = build_ext(dist)
+    cmd.build_lib = str(build_dir / "lib")
+    cmd.build_temp = str(build_dir / "temp")
+    cmd.ensure_finalized()
+    cmd.run()
+    return Path(cmd.get_outputs()[0])
+
+
+class CustomBuildHook(BuildHookInterface):
+    def initialize(self, version: str, build_data: dict) -> None:
+        if self.target_name != "wheel":
+            return
+
+        root = Path(self.root)
+        self._build_dir = Path(tempfile.mkdtemp(prefix="curseforge-dl-build-"))
+        try:
+            built = _build_extension(root, self._build_dir)
+        except Exception as e:
+            if os.environ.get("CURSEFORGE_DL_REQUIRE_EXT") == "1":
+                raise
+            self.app.display_warning(
+                f"Could not build {EXT_NAME} ({e}); using pure-Python fingerprinting"
+            )
+            return
+
+        if version == "editable":
+            # Editable installs import from src/, so place the module there
+            shutil.copy2(built, root / "src" / "curseforge_dl" / built.name)
+        else:
+            build_data["force_include"][str(built)] = f"curseforge_dl/{built.name}"
+            build_data["pure_python"] = False
+            build_data["infer_tag"] = True
+
+    def finalize(self, version: str, build_data: dict, artifact_path: str) -> None:
+        build_dir = getattr(self, "_build_dir", None)
+        if build_dir is not None:
+            shutil.rmtree(build_dir, ignore_errors=True)
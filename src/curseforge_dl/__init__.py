@@ -13,9 +13,13 @@ from curseforge_dl.models import (
     AddonFile,
 )
 from curseforge_dl.api import CurseForgeAPI
+from curseforge_dl.cache import ApiCache
 from curseforge_dl.installer import ModpackInstaller
 from curseforge_dl.url import build_cdn_url, get_download_url
-from curseforge_dl.fingerprint import curseforge_fingerprint
+from curseforge_dl.fingerprint import (
+    curseforge_fingerprint,
+    curseforge_fingerprint_many,
+)
 
 __all__ = [
     "CurseManifest",
@@ -25,10 +29,12 @@ __all__ = [
     "CurseAddon",
     "AddonFile",
     "CurseForgeAPI",
+    "ApiCache",
     "ModpackInstaller",
     "build_cdn_url",
     "get_download_url",
     "curseforge_fingerprint",
+    "curseforge_fingerprint_many",
 ]
 
 __version__ = "0.1.0"
@@ -2,7 +2,8 @@
 Async CurseForge API client.
 
 Wraps the CurseForge v1 REST API with an :class:`httpx.AsyncClient`, adding
-automatic API key header injection and concurrency limiting (semaphore).
+automatic API key header injection, concurrency limiting (semaphore) and a
+persistent response cache (see :mod:`curseforge_dl.cache`).
 
 Reference: https://docs.curseforge.com/
 """
@@ -10,24 +11,93 @@ Reference: https://docs.curseforge.com/
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
+import logging
 import os
-from typing import Optional
+import random
+import re
+import ssl
+import time
+from typing import Generic, Optional, TypeVar
+from urllib.parse import urlencode
 
 import httpx
 from dotenv import load_dotenv
+from pydantic import BaseModel
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional, see the ``speedups`` extra
+    json_loads = json.loads
 
 # Load .env so CURSEFORGE_API_KEY can be set via .env file
 load_dotenv()
 
+from curseforge_dl.cache import ApiCache, caching_disabled
 from curseforge_dl.models import (
     AddonFile,
     CurseAddon,
     AddonCategory,
 )
+from curseforge_dl.url import build_cdn_url
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_API_BASE = "https://api.curseforge.com"
 MINECRAFT_GAME_ID = 432
 DEFAULT_CONCURRENCY = 16
+# Rate-limited / overloaded responses are retried with backoff
+RETRY_STATUSES = (429, 503)
+MAX_RETRIES = 5
+# Hold back new requests once the API reports fewer calls left than this,
+# until its window resets (capped, in case of a bogus reset header)
+RATE_LIMIT_RESERVE = 2
+MAX_RATE_LIMIT_WAIT = 60.0
+# ``X-RateLimit-Reset`` values above this (September 2001) are Unix
+# timestamps, smaller ones are seconds from now
+RESET_EPOCH_THRESHOLD = 1_000_000_000
+# Max IDs per request for the bulk ``POST /v1/mods`` and ``/v1/mods/files``
+BULK_CHUNK_SIZE = 1000
+
+# Cache lifetime per endpoint, first match wins (seconds, None = forever)
+CACHE_TTLS: list[tuple[re.Pattern[str], Optional[float]]] = [
+    # A specific file of a mod never changes once published
+    (re.compile(r"^/v1/mods/\d+/files/\d+$"), None),
+    (re.compile(r"^/v1/mods/files$"), None),
+    (re.compile(r"^/v1/mods(/\d+)?$"), 24 * 3600),
+    (re.compile(r"^/v1/categories$"), 24 * 3600),
+]
+DEFAULT_CACHE_TTL = 5 * 60
+
+T = TypeVar("T")
+ItemT = TypeVar("ItemT", CurseAddon, AddonFile)
+
+
+class _Envelope(BaseModel, Generic[T]):
+    """The ``{"data": ...}`` wrapper around every CurseForge API response."""
+
+    data: T
+
+
+# Validated straight from the raw JSON bytes, so whole pages are parsed in
+# pydantic-core without building intermediate Python dicts first
+_ADDON = _Envelope[CurseAddon]
+_ADDON_LIST = _Envelope[list[CurseAddon]]
+_FILE = _Envelope[AddonFile]
+_FILE_LIST = _Envelope[list[AddonFile]]
+_CATEGORY_LIST = _Envelope[list[AddonCategory]]
+
+
+@functools.lru_cache(maxsize=None)
+def shared_ssl_context() -> ssl.SSLContext:
+    """
+    SSL context shared by every HTTP client in the process.
+
+    Creating a context loads the whole CA bundle (tens of milliseconds), which
+    a fresh :class:`httpx.AsyncClient` would otherwise pay each time.
+    """
+    return httpx.create_ssl_context()
 
 
 class CurseForgeAPI:
@@ -47,13 +117,29 @@ class CurseForgeAPI:
         api_base: str = DEFAULT_API_BASE,
         concurrency: int = DEFAULT_CONCURRENCY,
         timeout: float = 30.0,
+        cache: Optional[ApiCache] = None,
     ):
         self.api_key = api_key or os.environ.get("CURSEFORGE_API_KEY", "")
         self.api_base = api_base.rstrip("/")
+        if caching_disabled():
+            self._cache = None
+        else:
+            self._cache = cache or ApiCache()
         self._semaphore = asyncio.Semaphore(concurrency)
+        # time.monotonic() before which no new request is sent
+        self._resume_at = 0.0
+        # Pool sized to the semaphore so neither silently queues behind the
+        # other; HTTP/2 multiplexes the many small API calls on few sockets.
         self._client = httpx.AsyncClient(
             timeout=timeout,
             headers=self._build_headers(),
+            verify=shared_ssl_context(),
+            limits=httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+                keepalive_expiry=30,
+            ),
+            http2=True,
         )
 
     def _build_headers(self) -> dict[str, str]:
@@ -75,24 +161,136 @@ class CurseForgeAPI:
 
     async def close(self) -> None:
         await self._client.aclose()
+        if self._cache is not None:
+            self._cache.close()
 
     # ── Low-level helpers ──────────────────────────────────────────
 
+    @staticmethod
+    def _cache_ttl(path: str) -> Optional[float]:
+        for pattern, ttl in CACHE_TTLS:
+            if pattern.match(path):
+                return ttl
+        return DEFAULT_CACHE_TTL
+
     async def _get(self, path: str, params: Optional[dict] = None) -> dict:
-        async with self._semaphore:
-            resp = await self._client.get(
-                f"{self.api_base}{path}", params=params
-            )
-            resp.raise_for_status()
-            return resp.json()
+        return json_loads(await self._get_raw(path, params))
 
     async def _post(self, path: str, json_body: dict) -> dict:
-        async with self._semaphore:
-            resp = await self._client.post(
-                f"{self.api_base}{path}", json=json_body
-            )
+        return json_loads(await self._post_raw(path, json_body))
+
+    async def _get_raw(self, path: str, params: Optional[dict] = None) -> bytes:
+        key = f"GET {self.api_base}{path}?{urlencode(sorted((params or {}).items()))}"
+        return await self._request("GET", path, key, params=params)
+
+    async def _post_raw(self, path: str, json_body: dict) -> bytes:
+        key = f"POST {self.api_base}{path} {json.dumps(json_body, sort_keys=True)}"
+        return await self._request("POST", path, key, json=json_body)
+
+    async def _request(
+        self, method: str, path: str, cache_key: Optional[str], **kwargs
+    ) -> bytes:
+        """
+        Send a request and return the raw JSON body, from the cache when possible.
+
+        ``cache_key=None`` bypasses the response cache for this request.
+
+        429 / 503 responses are retried up to :data:`MAX_RETRIES` times,
+        honoring ``Retry-After`` (see :func:`_retry_delay`). Rate-limit
+        headers pause every request of this client, not just the one that
+        saw them.
+        """
+        cache = self._cache if cache_key is not None else None
+        body = cache.get(cache_key) if cache is not None else None
+        if body is None:
+            for attempt in range(1, MAX_RETRIES + 1):
+                await self._wait_for_rate_limit()
+                async with self._semaphore:
+                    resp = await self._client.request(
+                        method, f"{self.api_base}{path}", **kwargs
+                    )
+                self._note_rate_limit(resp)
+                if resp.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    break
+                wait = _retry_delay(resp, attempt)
+                self._pause(wait)
+                logger.warning(
+                    "%s %s returned %d (attempt %d/%d) — retrying in %.1fs",
+                    method, path, resp.status_code, attempt, MAX_RETRIES, wait,
+                )
+                await asyncio.sleep(wait)
             resp.raise_for_status()
-            return resp.json()
+            body = resp.content
+            if cache is not None:
+                cache.set(cache_key, body, self._cache_ttl(path))
+        return body
+
+    async def _post_many(
+        self, path: str, field: str, ids: list[int], item_type: type[ItemT]
+    ) -> list[ItemT]:
+        """
+        Look up ``ids`` through a bulk ``POST`` endpoint, chunked by
+        :data:`BULK_CHUNK_SIZE`.
+
+        Items are cached one by one rather than per request, so a modpack
+        update only asks for the IDs it has not seen before.
+        """
+        envelope = _Envelope[list[item_type]]
+        items: list[ItemT] = []
+        missing = ids
+        if self._cache is not None:
+            missing = []
+            for item_id in ids:
+                body = self._cache.get(f"POST {self.api_base}{path} #{item_id}")
+                if body is None:
+                    missing.append(item_id)
+                else:
+                    items.append(item_type.model_validate_json(body))
+
+        pages = await asyncio.gather(
+            *(
+                self._request("POST", path, None, json={field: chunk})
+                for chunk in _chunked(missing, BULK_CHUNK_SIZE)
+            )
+        )
+        for page in pages:
+            fetched = envelope.model_validate_json(page).data
+            items.extend(fetched)
+            if self._cache is not None:
+                self._cache.set_many(
+                    (
+                        (
+                            f"POST {self.api_base}{path} #{item.id}",
+                            item.model_dump_json(by_alias=True).encode(),
+                        )
+                        for item in fetched
+                    ),
+                    self._cache_ttl(path),
+                )
+        return items
+
+    async def _wait_for_rate_limit(self) -> None:
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            logger.debug("Rate limit reached — waiting %.1fs", delay)
+            await asyncio.sleep(delay)
+
+    def _pause(self, seconds: float) -> None:
+        seconds = min(seconds, MAX_RATE_LIMIT_WAIT)
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def _note_rate_limit(self, resp: httpx.Response) -> None:
+        """Pause until the window resets if ``X-RateLimit-Remaining`` runs low."""
+        try:
+            remaining = int(resp.headers["X-RateLimit-Remaining"])
+            reset = float(resp.headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        if remaining < RATE_LIMIT_RESERVE:
+            if reset > RESET_EPOCH_THRESHOLD:
+                # A timestamp slightly in the past means the window has reset
+                reset = max(0.0, reset - time.time())
+            self._pause(reset)
 
     # ── Mod search & lookup ────────────────────────────────────────
 
@@ -143,13 +341,22 @@ class CurseForgeAPI:
         if slug:
             params["slug"] = slug
 
-        data = await self._get("/v1/mods/search", params=params)
-        return [CurseAddon.model_validate(item) for item in data.get("data", [])]
+        body = await self._get_raw("/v1/mods/search", params=params)
+        return _ADDON_LIST.model_validate_json(body).data
 
     async def get_mod(self, mod_id: int) -> CurseAddon:
         """Get a single mod/addon by its ID."""
-        data = await self._get(f"/v1/mods/{mod_id}")
-        return CurseAddon.model_validate(data["data"])
+        body = await self._get_raw(f"/v1/mods/{mod_id}")
+        return _ADDON.model_validate_json(body).data
+
+    async def get_mods(self, mod_ids: list[int]) -> list[CurseAddon]:
+        """
+        Get many mods/addons at once via ``POST /v1/mods``.
+
+        IDs are sent in chunks of :data:`BULK_CHUNK_SIZE`. Unknown IDs are
+        simply missing from the result; order is not guaranteed.
+        """
+        return await self._post_many("/v1/mods", "modIds", mod_ids, CurseAddon)
 
     async def get_mod_by_slug(
         self, slug: str, class_id: int = 6
@@ -158,13 +365,16 @@ class CurseForgeAPI:
         Find a mod/addon by its slug.
 
         Uses the search API with the ``slug`` parameter and returns the first
-        exact match, or ``None`` if no match is found.
+        exact match, or ``None`` if no match is found. Slugs are unique per
+        class, so a single result is requested. The returned addon carries
+        ``latest_files``, which is enough to pick a file without another
+        request.
 
         Args:
             slug: The project slug (e.g. ``"all-the-mods-10"``).
             class_id: Class ID to filter by (default 6=Mods, 4471=Modpacks).
         """
-        results = await self.search_mods(slug=slug, class_id=class_id, page_size=5)
+        results = await self.search_mods(slug=slug, class_id=class_id, page_size=1)
         for addon in results:
             if addon.slug == slug:
                 return addon
@@ -172,17 +382,26 @@ class CurseForgeAPI:
 
     async def get_mod_file(self, mod_id: int, file_id: int) -> AddonFile:
         """Get a specific file for a mod."""
-        data = await self._get(f"/v1/mods/{mod_id}/files/{file_id}")
-        return AddonFile.model_validate(data["data"])
+        body = await self._get_raw(f"/v1/mods/{mod_id}/files/{file_id}")
+        return _FILE.model_validate_json(body).data
+
+    async def get_files(self, file_ids: list[int]) -> list[AddonFile]:
+        """
+        Get many files (of any mods) at once via ``POST /v1/mods/files``.
+
+        IDs are sent in chunks of :data:`BULK_CHUNK_SIZE`. Unknown IDs are
+        simply missing from the result; order is not guaranteed.
+        """
+        return await self._post_many("/v1/mods/files", "fileIds", file_ids, AddonFile)
 
     async def get_mod_files(
         self, mod_id: int, page_size: int = 10000
     ) -> list[AddonFile]:
         """Get all files for a mod."""
-        data = await self._get(
+        body = await self._get_raw(
             f"/v1/mods/{mod_id}/files", params={"pageSize": page_size}
         )
-        return [AddonFile.model_validate(item) for item in data.get("data", [])]
+        return _FILE_LIST.model_validate_json(body).data
 
     async def get_mod_file_download_url(self, mod_id: int, file_id: int) -> str:
         """
@@ -197,15 +416,14 @@ class CurseForgeAPI:
             return url
         # Fallback: get file info and build CDN URL
         addon_file = await self.get_mod_file(mod_id, file_id)
-        from curseforge_dl.url import build_cdn_url
         return build_cdn_url(addon_file.id, addon_file.file_name)
 
     async def get_categories(self) -> list[AddonCategory]:
         """Get all categories for Minecraft."""
-        data = await self._get(
+        body = await self._get_raw(
             "/v1/categories", params={"gameId": MINECRAFT_GAME_ID}
         )
-        return [AddonCategory.model_validate(item) for item in data.get("data", [])]
+        return _CATEGORY_LIST.model_validate_json(body).data
 
     # ── Fingerprint matching ───────────────────────────────────────
 
@@ -222,3 +440,19 @@ class CurseForgeAPI:
             {"fingerprints": fingerprints},
         )
         return data.get("data", {}).get("exactMatches", [])
+
+
+def _chunked(items: list[int], size: int) -> list[list[int]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying: ``Retry-After`` or 2^attempt, plus
+    jitter, capped at :data:`MAX_RATE_LIMIT_WAIT`.
+    """
+    try:
+        delay = float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = 2 ** attempt
+    return min(delay + random.random(), MAX_RATE_LIMIT_WAIT)
@@ -0,0 +1,143 @@
+"""
+Persistent on-disk cache for CurseForge API responses.
+
+Re-installing or repairing a modpack asks the API for the same mods and
+files again; CurseForge rate-limits aggressively, so those round trips cost
+both time and quota. :class:`ApiCache` keeps raw JSON response bodies in a
+small SQLite database under the user cache directory, each with an optional
+expiry time.
+
+Set ``CF_DISABLE_API_CACHING=1`` to bypass the cache entirely.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DISABLE_ENV_VAR = "CF_DISABLE_API_CACHING"
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory for curseforge-dl."""
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "curseforge-dl"
+
+
+def caching_disabled() -> bool:
+    """Whether caching is turned off via ``CF_DISABLE_API_CACHING``."""
+    return os.environ.get(DISABLE_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+class ApiCache:
+    """
+    Key/value store of API response bodies with per-entry expiry.
+
+    The database is opened lazily on first use, and expired entries are
+    purged at that point. If it cannot be opened (e.g. read-only home
+    directory) the cache disables itself and every lookup is a miss.
+    Errors on an open database (another process holding a lock, a full
+    disk) are logged and treated as a miss or a skipped write.
+
+    Usage::
+
+        cache = ApiCache()
+        cache.set("GET /v1/mods/238222", body, ttl=3600)
+        body = cache.get("GET /v1/mods/238222")
+    """
+
+    def __init__(self, path: Optional[str | Path] = None):
+        self.path = Path(path) if path else default_cache_dir() / "api.db"
+        self._conn: Optional[sqlite3.Connection] = None
+        self._broken = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._broken:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    " key TEXT PRIMARY KEY,"
+                    " body BLOB NOT NULL,"
+                    " expires_at REAL)"
+                )
+                with conn:
+                    conn.execute(
+                        "DELETE FROM responses WHERE expires_at < ?", (time.time(),)
+                    )
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("API cache disabled, cannot open %s: %s", self.path, e)
+                self._broken = True
+        return self._conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for ``key``, or ``None`` if missing or expired."""
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("API cache read failed: %s", e)
+            return None
+        if row is None:
+            return None
+        body, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return body
+
+    def set(self, key: str, body: bytes, ttl: Optional[float] = None) -> None:
+        """Store ``body`` under ``key``; ``ttl=None`` means it never expires."""
+        conn = self._connect()
+        if conn is None:
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, body, expires_at)"
+                    " VALUES (?, ?, ?)",
+                    (key, body, expires_at),
+                )
+        except sqlite3.Error as e:
+            logger.warning("API cache write failed: %s", e)
+
+    def set_many(
+        self, items: Iterable[tuple[str, bytes]], ttl: Optional[float] = None
+    ) -> None:
+        """Store several ``(key, body)`` pairs in a single transaction."""
+        conn = self._connect()
+        if conn is None:
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO responses (key, body, expires_at)"
+                    " VALUES (?, ?, ?)",
+                    ((key, body, expires_at) for key, body in items),
+                )
+        except sqlite3.Error as e:
+            logger.warning("API cache write failed: %s", e)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -12,11 +12,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
-from pathlib import Path
 
 import click
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # optional, see the ``speedups`` extra (not on Windows)
+    uvloop = None
+
 # Load .env file so CURSEFORGE_API_KEY (and others) can be set via .env
 load_dotenv()
 
@@ -24,6 +28,13 @@ from curseforge_dl.api import CurseForgeAPI
 from curseforge_dl.installer import ModpackInstaller
 
 
+def _run(coro):
+    """Run a command's coroutine, on uvloop's faster event loop if installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 def _setup_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
@@ -58,14 +69,14 @@ def install(ctx: click.Context, zipfile: str, output_dir: str, concurrency: int)
         sys.exit(1)
 
     async def run():
-        async with CurseForgeAPI(api_key=api_key) as api:
-            installer = ModpackInstaller(api, concurrency=concurrency)
-            manifest = await installer.install(zipfile, output_dir)
+        async with CurseForgeAPI(api_key=api_key, concurrency=concurrency) as api:
+            async with ModpackInstaller(api, concurrency=concurrency) as installer:
+                manifest = await installer.install(zipfile, output_dir)
             click.echo(f"\n✓ Installed '{manifest.name}' v{manifest.version}")
             click.echo(f"  Files: {len(manifest.files)}")
             click.echo(f"  Output: {output_dir}")
 
-    asyncio.run(run())
+    _run(run())
 
 
 @main.command()
@@ -101,7 +112,7 @@ def search(ctx: click.Context, query: str, game_version: str, class_id: int, lim
                     else f"  [{mod.id}] {mod.name} by {authors}  — {mod.summary}"
                 )
 
-    asyncio.run(run())
+    _run(run())
 
 
 @main.command()
@@ -132,7 +143,7 @@ def info(ctx: click.Context, mod_id: int) -> None:
             for f in mod.latest_files[:5]:
                 click.echo(f"  [{f.id}] {f.display_name}  ({f.file_name})")
 
-    asyncio.run(run())
+    _run(run())
 
 
 @main.command("modpack-info")
@@ -143,7 +154,7 @@ def modpack_info(zipfile: str, show_mods: bool) -> None:
     from curseforge_dl.installer import ModpackInstaller
 
     try:
-        manifest = ModpackInstaller._parse_manifest(Path(zipfile))
+        manifest = ModpackInstaller.parse_modpack_info(zipfile)
     except FileNotFoundError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -211,8 +222,7 @@ def fetch(ctx: click.Context, slug: str, game_version: str) -> None:
             click.echo("=" * 55)
 
             # Show latest files
-            installer = ModpackInstaller(api)
-            latest = installer._select_latest_file(addon, game_version)
+            latest = ModpackInstaller._select_latest_file(addon, game_version)
             if latest:
                 click.echo(f"\n  Latest file:")
                 click.echo(f"    Name:      {latest.display_name or latest.file_name}")
@@ -236,7 +246,7 @@ def fetch(ctx: click.Context, slug: str, game_version: str) -> None:
                     server = " [server]" if f.is_server_pack else ""
                     click.echo(f"    [{f.id}] {f.display_name or f.file_name}{server}")
 
-    asyncio.run(run())
+    _run(run())
 
 
 @main.command()
@@ -252,8 +262,7 @@ def download(ctx: click.Context, slug: str, output_dir: str, game_version: str)
         sys.exit(1)
 
     async def run():
-        async with CurseForgeAPI(api_key=api_key) as api:
-            installer = ModpackInstaller(api)
+        async with CurseForgeAPI(api_key=api_key) as api, ModpackInstaller(api) as installer:
             try:
                 zip_path, addon, file_info = await installer.download_modpack_by_slug(
                     slug, output_dir=output_dir, game_version=game_version
@@ -267,7 +276,7 @@ def download(ctx: click.Context, slug: str, output_dir: str, game_version: str)
                 click.echo(f"Error: {e}", err=True)
                 sys.exit(1)
 
-    asyncio.run(run())
+    _run(run())
 
 
 if __name__ == "__main__":
@@ -14,17 +14,30 @@ Mirrors the logic of ``CurseInstallTask`` + ``CurseCompletionTask`` in HMCL.
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import functools
+import hashlib
 import logging
+import os
+import random
+import shutil
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional, TypeVar
 
 import httpx
 from tqdm import tqdm
 
-from curseforge_dl.api import CurseForgeAPI
+from curseforge_dl.api import (
+    MAX_RATE_LIMIT_WAIT,
+    RETRY_STATUSES,
+    CurseForgeAPI,
+    json_loads,
+    shared_ssl_context,
+)
 from curseforge_dl.models import (
     AddonFile,
     CurseAddon,
@@ -35,10 +48,46 @@ from curseforge_dl.models import (
     SECTION_RESOURCE_PACK,
     SECTION_SHADER_PACK,
 )
-from curseforge_dl.url import build_cdn_url, get_download_url
+from curseforge_dl.url import CDN_BASE, get_download_url
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+# Sort key for files without a date
+_EPOCH_MIN = datetime.min
+# Tells _run_workers' workers that the queue has been drained
+_DONE = object()
+
+# Bytes per streamed download chunk: few loop iterations / writes per file
+DOWNLOAD_CHUNK = 256 * 1024
+# Download chunks are collected and written (and hashed) on a worker thread
+# once per this many bytes, keeping disk I/O off the event loop
+WRITE_BUFFER = 1024 * 1024
+# Bytes per read/write when extracting an override entry
+EXTRACT_CHUNK = 1024 * 1024
+# Bounds of the jittered delay between download attempts (seconds)
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
+def _releases_client(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Close the installer's download client once ``method`` returns, unless an
+    ``async with`` block owns it (or another such call is still running).
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: ModpackInstaller, *args, **kwargs) -> T:
+        self._calls += 1
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self._calls -= 1
+            if not self._entered and not self._calls:
+                await self.close()
+
+    return wrapper
+
 
 class ModpackInstaller:
     """
@@ -47,8 +96,12 @@ class ModpackInstaller:
     Usage::
 
         async with CurseForgeAPI(api_key="...") as api:
-            installer = ModpackInstaller(api)
-            await installer.install("modpack.zip", "./minecraft")
+            async with ModpackInstaller(api) as installer:
+                await installer.install("modpack.zip", "./minecraft")
+
+    Inside ``async with`` the download connections stay open across calls.
+    Used without it, each :meth:`install` / :meth:`download_modpack_by_slug`
+    call closes them when it returns.
     """
 
     def __init__(
@@ -62,9 +115,54 @@ class ModpackInstaller:
         self._concurrency = concurrency
         self._download_timeout = download_timeout
         self._max_retries = max_retries
+        self._client: Optional[httpx.AsyncClient] = None
+        # Whether an ``async with`` block owns the client, and how many
+        # public calls are using it (see _releases_client)
+        self._entered = False
+        self._calls = 0
+        # Transfers in flight; shrinks while the CDN is throttling
+        self._limit = _AdaptiveLimit(concurrency)
+
+    async def __aenter__(self) -> ModpackInstaller:
+        self._entered = True
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._entered = False
+        await self.close()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _download_client(self) -> httpx.AsyncClient:
+        """
+        HTTP client shared by all downloads, created on first use.
+
+        Almost every file comes from the same CDN host, so keep-alive
+        connections are reused instead of paying a TCP + TLS handshake per
+        file. Plain HTTP/1.1: parallel connections move bulk data faster
+        than HTTP/2 streams multiplexed over a single one.
+        """
+        if self._client is None:
+            # One connection per download worker: no worker ever waits on
+            # the pool, and no connection sits idle beyond the keep-alive set
+            self._client = httpx.AsyncClient(
+                timeout=self._download_timeout,
+                follow_redirects=True,
+                verify=shared_ssl_context(),
+                limits=httpx.Limits(
+                    max_connections=self._concurrency,
+                    max_keepalive_connections=self._concurrency,
+                    keepalive_expiry=30,
+                ),
+            )
+        return self._client
 
     # ── Public entry point ─────────────────────────────────────────
 
+    @_releases_client
     async def install(
         self,
         zip_path: str | Path,
@@ -86,21 +184,47 @@ class ModpackInstaller:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # 1. Parse manifest
-        manifest = self._parse_manifest(zip_path)
-        logger.info(
-            "Modpack: %s v%s by %s (%d files)",
-            manifest.name,
-            manifest.version,
-            manifest.author,
-            len(manifest.files),
-        )
+        warm_up: Optional[asyncio.Task] = None
+        resolve: Optional[asyncio.Task] = None
+        try:
+            # One handle for both zip steps, so the central directory is read
+            # once; zip work runs off the event loop
+            with zipfile.ZipFile(zip_path, "r") as zf:
+                # 1. Parse manifest
+                manifest = await asyncio.to_thread(self._parse_manifest, zf)
+                logger.info(
+                    "Modpack: %s v%s by %s (%d files)",
+                    manifest.name,
+                    manifest.version,
+                    manifest.author,
+                    len(manifest.files),
+                )
 
-        # 2. Extract overrides
-        self._extract_overrides(zip_path, output_dir, manifest.overrides)
+                # Open CDN connections while the zip and API phases run; only
+                # a hint, so it is dropped once resolution is done
+                if manifest.files:
+                    warm_up = asyncio.create_task(self._warm_up_cdn(self._concurrency))
 
-        # 3. Resolve file info (fileName + downloadUrl) via API
-        resolved_files = await self._resolve_files(manifest.files, progress_callback)
+                # 3. Resolve file info (fileName + downloadUrl) via API,
+                #    started first so it overlaps with step 2
+                resolve = asyncio.create_task(
+                    self._resolve_files(manifest.files, progress_callback)
+                )
+
+                # 2. Extract overrides
+                await asyncio.to_thread(
+                    self._extract_overrides, zf, output_dir, manifest.overrides
+                )
+
+            resolved_files = await resolve
+        finally:
+            # Stop whatever is still running (the warm-up, or everything if a
+            # step failed) and wait for it, so no task outlives install() or
+            # leaves an unread error
+            background = [t for t in (warm_up, resolve) if t is not None]
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
 
         # 4. Download all files
         await self._download_files(resolved_files, output_dir, progress_callback)
@@ -118,7 +242,11 @@ class ModpackInstaller:
         )
         manifest_out = output_dir / "manifest.json"
         manifest_out.write_text(
-            resolved_manifest.model_dump_json(indent=2, by_alias=True),
+            # sha1 is only used to verify downloads; keep the file in the
+            # standard manifest format
+            resolved_manifest.model_dump_json(
+                indent=2, by_alias=True, exclude={"files": {"__all__": {"sha1"}}}
+            ),
             encoding="utf-8",
         )
         logger.info("Resolved manifest saved to %s", manifest_out)
@@ -127,6 +255,7 @@ class ModpackInstaller:
 
     # ── Download modpack by slug ──────────────────────────────────
 
+    @_releases_client
     async def download_modpack_by_slug(
         self,
         slug: str,
@@ -159,7 +288,8 @@ class ModpackInstaller:
 
         logger.info("Found modpack: %s (ID=%d)", addon.name, addon.id)
 
-        # 2. Select the best (latest) file
+        # 2. Select the best (latest) file from the search payload's
+        #    latestFiles, so no extra file lookup is needed
         latest_file = self._select_latest_file(addon, game_version)
         if latest_file is None:
             raise ValueError(
@@ -176,20 +306,17 @@ class ModpackInstaller:
             else "size unknown",
         )
 
-        # 3. Resolve download URL
+        # 3. Resolve download URL (API URL, or the CDN URL built from it)
         download_url = get_download_url(latest_file)
-        if not download_url:
-            # Fallback via API endpoint
-            download_url = await self.api.get_mod_file_download_url(
-                addon.id, latest_file.id
-            )
 
         # 4. Download the file
         target = output_dir / latest_file.file_name
         if target.exists():
             logger.info("File already exists: %s", target)
         else:
-            await self._download_file_with_progress(download_url, target)
+            await self._download_file(
+                download_url, target, show_progress=True, sha1=latest_file.sha1
+            )
 
         return target, addon, latest_file
 
@@ -200,8 +327,8 @@ class ModpackInstaller:
         """
         Select the latest non-server-pack file from the addon's ``latestFiles``.
 
-        Optionally filters by ``game_version``. Files are sorted by date
-        descending to pick the most recent one.
+        Optionally filters by ``game_version``, then picks the most recent
+        one by date.
         """
         candidates = [
             f
@@ -218,46 +345,19 @@ class ModpackInstaller:
         if not candidates:
             return None
 
-        # Sort by file_date descending (most recent first)
-        candidates.sort(
-            key=lambda f: f.file_date or datetime.min, reverse=True
-        )
-        return candidates[0]
-
-    async def _download_file_with_progress(
-        self, url: str, target: Path
-    ) -> None:
-        """Download a single file with a tqdm progress bar showing bytes."""
-        async with httpx.AsyncClient(
-            timeout=self._download_timeout, follow_redirects=True
-        ) as client:
-            async with client.stream("GET", url) as resp:
-                resp.raise_for_status()
-                total = int(resp.headers.get("content-length", 0))
-                target.parent.mkdir(parents=True, exist_ok=True)
-                pbar = tqdm(
-                    total=total or None,
-                    desc=target.name,
-                    unit="B",
-                    unit_scale=True,
-                    unit_divisor=1024,
-                )
-                with open(target, "wb") as fp:
-                    async for chunk in resp.aiter_bytes(8192):
-                        fp.write(chunk)
-                        pbar.update(len(chunk))
-                pbar.close()
+        # Most recent file_date wins (first one on ties)
+        return max(candidates, key=lambda f: f.file_date or _EPOCH_MIN)
 
     # ── Step 1: Parse manifest ─────────────────────────────────────
 
     @staticmethod
-    def _parse_manifest(zip_path: Path) -> CurseManifest:
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            # manifest.json is usually at the root of the zip
-            for name in zf.namelist():
-                if name == "manifest.json" or name.endswith("/manifest.json"):
-                    raw = json.loads(zf.read(name))
-                    return CurseManifest.model_validate(raw)
+    def _parse_manifest(zf: zipfile.ZipFile) -> CurseManifest:
+        # manifest.json is usually at the root of the zip
+        for info in zf.infolist():
+            name = info.filename
+            if name == "manifest.json" or name.endswith("/manifest.json"):
+                raw = json_loads(zf.read(info))
+                return CurseManifest.model_validate(raw)
         raise FileNotFoundError("No manifest.json found in modpack zip")
 
     @staticmethod
@@ -280,32 +380,55 @@ class ModpackInstaller:
                 print(loader.id)                          # "neoforge-21.1.219"
             print(len(manifest.files))                     # 480
         """
-        return ModpackInstaller._parse_manifest(Path(zip_path))
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            return ModpackInstaller._parse_manifest(zf)
 
     # ── Step 2: Extract overrides ──────────────────────────────────
 
     @staticmethod
     def _extract_overrides(
-        zip_path: Path, output_dir: Path, overrides_prefix: str
+        zf: zipfile.ZipFile, output_dir: Path, overrides_prefix: str
     ) -> int:
-        """Extract override files from the zip to the output directory."""
-        count = 0
+        """
+        Extract override files from the zip to the output directory.
+
+        Entries are inflated on a thread pool (zlib releases the GIL) through
+        the shared ``zf`` handle. Each read of the archive already takes its
+        lock, but ``ZipFile.open`` and closing an entry update the handle's
+        reference count without it, so those two steps share ``open_lock``.
+        """
         prefix = overrides_prefix.rstrip("/") + "/"
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            for info in zf.infolist():
-                if not info.filename.startswith(prefix):
-                    continue
-                # Relative path inside the game directory
-                rel_path = info.filename[len(prefix) :]
-                if not rel_path or info.is_dir():
-                    continue
-                target = output_dir / rel_path
-                target.parent.mkdir(parents=True, exist_ok=True)
-                with zf.open(info) as src, open(target, "wb") as dst:
-                    dst.write(src.read())
-                count += 1
-        logger.info("Extracted %d override files", count)
-        return count
+        entries: list[tuple[zipfile.ZipInfo, Path]] = []
+        for info in zf.infolist():
+            if not info.filename.startswith(prefix):
+                continue
+            # Relative path inside the game directory
+            rel_path = info.filename[len(prefix) :]
+            if not rel_path or info.is_dir():
+                continue
+            entries.append((info, output_dir / rel_path))
+
+        for parent in {target.parent for _, target in entries}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        open_lock = threading.Lock()
+
+        def extract(entry: tuple[zipfile.ZipInfo, Path]) -> None:
+            info, target = entry
+            with open_lock:
+                src = zf.open(info)
+            try:
+                with open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, EXTRACT_CHUNK)
+            finally:
+                with open_lock:
+                    src.close()
+
+        with ThreadPoolExecutor() as pool:
+            for _ in pool.map(extract, entries):
+                pass
+        logger.info("Extracted %d override files", len(entries))
+        return len(entries)
 
     # ── Step 3: Resolve file names + URLs ──────────────────────────
 
@@ -315,74 +438,99 @@ class ModpackInstaller:
         progress_callback: Optional[Callable] = None,
     ) -> list[CurseManifestFile]:
         """
-        For each file in the manifest, query the API to get the file name
-        and download URL if they are missing.
+        Fill in the file name and download URL of manifest entries that lack
+        them, using one bulk ``POST /v1/mods/files`` lookup for all of them.
+        IDs missing from the bulk response, or all of them if the bulk lookup
+        fails, are looked up individually.
         """
-        semaphore = asyncio.Semaphore(self._concurrency)
-        resolved: list[CurseManifestFile] = [None] * len(files)  # type: ignore
         total = len(files)
-        finished = 0
+        pending_ids = [f.file_id for f in files if not (f.file_name and f.url)]
+
+        addon_files: dict[int, AddonFile] = {}
+        if pending_ids:
+            try:
+                for addon_file in await self.api.get_files(pending_ids):
+                    addon_files[addon_file.id] = addon_file
+            except Exception as e:
+                logger.error(
+                    "Bulk lookup of %d files failed, resolving them one by one: %s",
+                    len(pending_ids),
+                    e,
+                )
 
-        pbar = tqdm(total=total, desc="Resolving files", unit="file")
+        # Retry whatever the bulk response left out one by one
+        missing = [
+            f for f in files
+            if not (f.file_name and f.url) and f.file_id not in addon_files
+        ]
 
-        async def resolve_one(idx: int, f: CurseManifestFile):
-            nonlocal finished
-            async with semaphore:
-                if f.file_name and f.url:
-                    resolved[idx] = f
-                else:
-                    try:
-                        addon_file = await self.api.get_mod_file(
-                            f.project_id, f.file_id
-                        )
-                        download_url = addon_file.download_url
-                        if not download_url:
-                            download_url = build_cdn_url(
-                                addon_file.id, addon_file.file_name
-                            )
-                        resolved[idx] = CurseManifestFile(
-                            projectID=f.project_id,
-                            fileID=f.file_id,
-                            fileName=addon_file.file_name,
-                            url=download_url,
-                            required=f.required,
-                        )
-                    except httpx.HTTPStatusError as e:
-                        if e.response.status_code == 404:
-                            logger.warning(
-                                "File not found: project=%d file=%d (deleted?)",
-                                f.project_id,
-                                f.file_id,
-                            )
-                            resolved[idx] = f
-                        else:
-                            logger.error(
-                                "API error for project=%d file=%d: %s",
-                                f.project_id,
-                                f.file_id,
-                                e,
-                            )
-                            resolved[idx] = f
-                    except Exception as e:
-                        logger.error(
-                            "Failed to resolve project=%d file=%d: %s",
-                            f.project_id,
-                            f.file_id,
-                            e,
-                        )
-                        resolved[idx] = f
-                finished += 1
-                pbar.update(1)
-                if progress_callback:
-                    progress_callback(finished, total, "Resolving file info")
-
-        tasks = [resolve_one(i, f) for i, f in enumerate(files)]
-        await asyncio.gather(*tasks)
+        # Lookups that errored; already logged, so not reported as deleted
+        failed: set[int] = set()
+
+        async def lookup_one(f: CurseManifestFile) -> None:
+            try:
+                addon_file = await self._get_file_or_none(f)
+            except httpx.HTTPStatusError as e:
+                logger.error(
+                    "API error for project=%d file=%d: %s", f.project_id, f.file_id, e
+                )
+                failed.add(f.file_id)
+            except Exception as e:
+                logger.error(
+                    "Failed to resolve project=%d file=%d: %s", f.project_id, f.file_id, e
+                )
+                failed.add(f.file_id)
+            else:
+                if addon_file is not None:
+                    addon_files[addon_file.id] = addon_file
+
+        await _run_workers(missing, lookup_one, self._concurrency)
+
+        pbar = tqdm(total=total, desc="Resolving files", unit="file")
+        resolved: list[CurseManifestFile] = []
+        ok_count = 0
+        for finished, f in enumerate(files, 1):
+            addon_file = addon_files.get(f.file_id)
+            if f.file_name and f.url:
+                resolved.append(f)
+                ok_count += 1
+            elif addon_file is None:
+                if f.file_id not in failed:
+                    logger.warning(
+                        "File not found: project=%d file=%d (deleted?)",
+                        f.project_id,
+                        f.file_id,
+                    )
+                resolved.append(f)
+                ok_count += bool(f.file_name)
+            else:
+                # The new values come from an already validated AddonFile
+                resolved.append(
+                    f.model_copy(
+                        update={
+                            "file_name": addon_file.file_name,
+                            "url": get_download_url(addon_file),
+                            "sha1": addon_file.sha1,
+                        }
+                    )
+                )
+                ok_count += bool(addon_file.file_name)
+            pbar.update(1)
+            if progress_callback:
+                progress_callback(finished, total, "Resolving file info")
         pbar.close()
 
-        ok_count = sum(1 for f in resolved if f and f.file_name)
         logger.info("Resolved %d / %d files", ok_count, total)
-        return [f for f in resolved if f is not None]
+        return resolved
+
+    async def _get_file_or_none(self, f: CurseManifestFile) -> Optional[AddonFile]:
+        """Look up a single file; ``None`` if the API has no such file (404)."""
+        try:
+            return await self.api.get_mod_file(f.project_id, f.file_id)
+        except httpx.HTTPStatusError as e:
+            if _is_not_found(e):
+                return None
+            raise
 
     # ── Step 4: Download files ─────────────────────────────────────
 
@@ -398,119 +546,377 @@ class ModpackInstaller:
             logger.warning("No files to download")
             return
 
-        # We need to determine the save path per file. For this we need to
-        # know the classId of each project. We batch-query (or cache) as needed.
-        file_targets = await self._determine_file_targets(downloadable, output_dir)
-
-        semaphore = asyncio.Semaphore(self._concurrency)
-        total = len(file_targets)
+        total = len(downloadable)
         finished = 0
 
         pbar = tqdm(total=total, desc="Downloading files", unit="file")
 
-        async def download_one(f: CurseManifestFile, target: Path):
+        async def download_one(item: tuple[CurseManifestFile, Path]):
             nonlocal finished
-            async with semaphore:
+            f, target = item
+            if target.exists() and await asyncio.to_thread(_has_sha1, target, f.sha1):
+                logger.debug("Skipping existing: %s", target.name)
+            else:
                 if target.exists():
-                    logger.debug("Skipping existing: %s", target.name)
-                else:
-                    last_error = None
-                    for attempt in range(1, self._max_retries + 1):
-                        try:
-                            await self._download_file(f.url, target)  # type: ignore
-                            last_error = None
-                            break
-                        except Exception as e:
-                            last_error = e
-                            if attempt < self._max_retries:
-                                wait = 2 ** attempt  # exponential backoff: 2, 4, 8...
-                                logger.warning(
-                                    "Download %s failed (attempt %d/%d): %s — retrying in %ds",
-                                    f.file_name, attempt, self._max_retries, e, wait,
-                                )
-                                # Clean up partial file
-                                if target.exists():
-                                    target.unlink()
-                                await asyncio.sleep(wait)
-                    if last_error is not None:
-                        logger.error(
-                            "Failed to download %s after %d attempts: %s",
-                            f.file_name, self._max_retries, last_error,
-                        )
-                        # Clean up partial file
-                        if target.exists():
-                            target.unlink()
-                finished += 1
-                pbar.update(1)
-                if progress_callback:
-                    progress_callback(finished, total, f"Downloading {f.file_name}")
-
-        tasks = [download_one(f, t) for f, t in file_targets]
-        await asyncio.gather(*tasks)
+                    logger.info("Replacing corrupt or outdated file: %s", target.name)
+                last_error = await self._download_with_retries(f, target)
+                if _is_not_found(last_error):
+                    # The CDN URL built from id + fileName is a guess; ask
+                    # the API for the real one only when the guess misses
+                    url = await self._lookup_download_url(f)
+                    if url and url != f.url:
+                        f.url = url
+                        last_error = await self._download_with_retries(f, target)
+                if last_error is not None:
+                    logger.error(
+                        "Failed to download %s after %d attempts: %s",
+                        f.file_name, self._max_retries, last_error,
+                    )
+            finished += 1
+            pbar.update(1)
+            if progress_callback:
+                progress_callback(finished, total, f"Downloading {f.file_name}")
+
+        # Save paths depend on each project's classId; downloads start on the
+        # files that need no lookup while the rest are being looked up
+        await _run_workers(
+            self._iter_file_targets(downloadable, output_dir),
+            download_one,
+            self._concurrency,
+        )
         pbar.close()
 
         logger.info("Downloaded %d files", total)
 
-    async def _determine_file_targets(
+    async def _warm_up_cdn(self, connections: int) -> None:
+        """
+        Open ``connections`` pooled keep-alive connections to the CDN.
+
+        Sent during file resolution, so the download burst starts on
+        connections that already finished DNS, TCP and TLS setup.
+        """
+
+        async def head() -> None:
+            try:
+                await self._download_client().head(CDN_BASE)
+            except httpx.HTTPError as e:
+                logger.debug("CDN warm-up request failed: %s", e)
+
+        await asyncio.gather(*(head() for _ in range(connections)))
+
+    async def _download_with_retries(
+        self, f: CurseManifestFile, target: Path
+    ) -> Optional[Exception]:
+        """
+        Download ``f.url`` to ``target``, backing off between attempts.
+
+        Returns the last error, or ``None`` on success. A 404 is returned
+        straight away, since retrying the same URL cannot help. Delays come
+        from :func:`_download_retry_delay`.
+        """
+        wait = RETRY_BASE_DELAY
+        for attempt in range(1, self._max_retries + 1):
+            try:
+                async with self._limit.slot():
+                    await self._download_file(f.url, target, sha1=f.sha1)  # type: ignore
+                return None
+            except Exception as e:
+                # The ``.part`` file is kept, the next attempt resumes it
+                if _is_not_found(e) or attempt == self._max_retries:
+                    return e
+                wait = _download_retry_delay(e, wait)
+                logger.warning(
+                    "Download %s failed (attempt %d/%d): %s — retrying in %.1fs",
+                    f.file_name, attempt, self._max_retries, e, wait,
+                )
+                await asyncio.sleep(wait)
+        return None
+
+    async def _lookup_download_url(self, f: CurseManifestFile) -> Optional[str]:
+        """Ask the API for a file's download URL, or ``None`` if that fails."""
+        try:
+            return await self.api.get_mod_file_download_url(f.project_id, f.file_id)
+        except Exception as e:
+            logger.warning("Could not get download URL for %s: %s", f.file_name, e)
+            return None
+
+    async def _iter_file_targets(
         self,
         files: list[CurseManifestFile],
         output_dir: Path,
-    ) -> list[tuple[CurseManifestFile, Path]]:
+    ) -> AsyncIterator[tuple[CurseManifestFile, Path]]:
         """
-        Determine the save path for each file based on its project's classId.
+        Yield ``(file, save path)`` pairs as soon as each path is known.
 
-        Mirrors ``CurseCompletionTask.guessFilePath()`` in HMCL.
+        A ``.jar`` can only be a mod, so those are yielded right away while
+        the projects of all other files (resource and shader packs ship as
+        ``.zip``) are looked up in the background. The path follows the
+        project's classId, mirroring ``CurseCompletionTask.guessFilePath()``
+        in HMCL.
         """
-        # Query class IDs in parallel
-        semaphore = asyncio.Semaphore(self._concurrency)
+        # Every file lands in one of a handful of directories; create each once
+        made: set[Path] = set()
+
+        def target(class_id: int, f: CurseManifestFile) -> Path:
+            path = self._file_target(output_dir, class_id, f)
+            if path.parent not in made:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                made.add(path.parent)
+            return path
+
+        others = [f for f in files if not _is_jar(f)]
+        lookup = asyncio.ensure_future(self._lookup_class_ids(others))
+        try:
+            for f in files:
+                if _is_jar(f):
+                    yield f, target(SECTION_MOD, f)
+            class_ids = await lookup
+        finally:
+            lookup.cancel()
+        for f in others:
+            yield f, target(class_ids.get(f.project_id, SECTION_MOD), f)
+
+    async def _lookup_class_ids(self, files: list[CurseManifestFile]) -> dict[int, int]:
+        """Map the projects of ``files`` to their classId with one bulk lookup."""
+        unique_ids = list(dict.fromkeys(f.project_id for f in files))
+        if not unique_ids:
+            return {}
         class_ids: dict[int, int] = {}
+        try:
+            for addon in await self.api.get_mods(unique_ids):
+                class_ids[addon.id] = addon.class_id
+        except Exception as e:
+            logger.warning("Could not get classIds for %d projects: %s", len(unique_ids), e)
 
-        async def fetch_class_id(project_id: int):
-            async with semaphore:
-                try:
-                    addon = await self.api.get_mod(project_id)
-                    class_ids[project_id] = addon.class_id
-                except Exception as e:
-                    logger.warning(
-                        "Could not get classId for project %d: %s", project_id, e
-                    )
-                    class_ids[project_id] = SECTION_MOD  # default to mods
+        missing = len(unique_ids) - len(class_ids)
+        if missing:
+            logger.warning("No classId for %d projects, defaulting to mods", missing)
+        return class_ids
 
-        # Deduplicate project IDs
-        unique_ids = set(f.project_id for f in files)
-        pbar = tqdm(total=len(unique_ids), desc="Querying mod types", unit="mod")
+    @staticmethod
+    def _file_target(output_dir: Path, class_id: int, f: CurseManifestFile) -> Path:
+        # Map classId → subdirectory
+        if class_id == SECTION_RESOURCE_PACK:
+            subdir = "resourcepacks"
+        elif class_id == SECTION_SHADER_PACK:
+            subdir = "shaderpacks"
+        else:
+            subdir = "mods"
+        return output_dir / subdir / f.file_name  # type: ignore
 
-        async def fetch_with_progress(pid: int):
-            await fetch_class_id(pid)
-            pbar.update(1)
+    async def _download_file(
+        self,
+        url: str,
+        target: Path,
+        show_progress: bool = False,
+        sha1: Optional[str] = None,
+    ) -> None:
+        """
+        Stream ``url`` to ``target``, optionally with a tqdm bar showing bytes.
+        The directory of ``target`` must already exist.
 
-        await asyncio.gather(*[fetch_with_progress(pid) for pid in unique_ids])
-        pbar.close()
+        Data goes to ``<target>.part``, which is renamed into place only once
+        complete, so an existing ``target`` is always a finished download.
+        A ``.part`` left by an interrupted attempt is resumed with a
+        ``Range`` request; servers that ignore it send the whole file again.
 
-        # Map classId → subdirectory
-        results = []
-        for f in files:
-            cid = class_ids.get(f.project_id, SECTION_MOD)
-            if cid == SECTION_RESOURCE_PACK:
-                subdir = "resourcepacks"
-            elif cid == SECTION_SHADER_PACK:
-                subdir = "shaderpacks"
-            else:
-                subdir = "mods"
-            target = output_dir / subdir / f.file_name  # type: ignore
-            target.parent.mkdir(parents=True, exist_ok=True)
-            results.append((f, target))
-
-        return results
-
-    async def _download_file(self, url: str, target: Path) -> None:
-        """Download a single file with streaming."""
-        async with httpx.AsyncClient(
-            timeout=self._download_timeout, follow_redirects=True
-        ) as client:
-            async with client.stream("GET", url) as resp:
-                resp.raise_for_status()
-                target.parent.mkdir(parents=True, exist_ok=True)
-                with open(target, "wb") as fp:
-                    async for chunk in resp.aiter_bytes(8192):
-                        fp.write(chunk)
+        If ``sha1`` is given, the content is hashed while it is written and
+        a mismatch discards the file and raises :class:`ValueError`.
+        """
+        part = target.with_name(target.name + ".part")
+        offset = part.stat().st_size if part.exists() else 0
+        digest = hashlib.sha1() if sha1 else None
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        async with self._download_client().stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 416:
+                # Stale .part no longer matches the file; start over next time
+                part.unlink()
+            resp.raise_for_status()
+            if resp.status_code != 206:
+                offset = 0
+            elif digest is not None:
+                await asyncio.to_thread(_hash_file, digest, part)
+            pbar = None
+            if show_progress:
+                length = int(resp.headers.get("content-length", 0))
+                pbar = tqdm(
+                    total=offset + length if length else None,
+                    initial=offset,
+                    desc=target.name,
+                    unit="B",
+                    unit_scale=True,
+                    unit_divisor=1024,
+                )
+            with open(part, "ab" if offset else "wb") as fp:
+
+                def write(block: bytearray) -> None:
+                    fp.write(block)
+                    if digest is not None:
+                        digest.update(block)
+
+                pending = bytearray()
+                async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK):
+                    pending += chunk
+                    if len(pending) >= WRITE_BUFFER:
+                        await asyncio.to_thread(write, pending)
+                        pending = bytearray()
+                    if pbar is not None:
+                        pbar.update(len(chunk))
+                if pending:
+                    await asyncio.to_thread(write, pending)
+            if pbar is not None:
+                pbar.close()
+        if digest is not None and digest.hexdigest() != sha1:
+            part.unlink()
+            raise ValueError(f"SHA-1 mismatch for {target.name}")
+        os.replace(part, target)
+
+
+async def _run_workers(
+    items: Iterable[T] | AsyncIterator[T],
+    process: Callable[[T], Awaitable[None]],
+    workers: int,
+) -> None:
+    """
+    Run ``process`` over ``items`` on at most ``workers`` long-lived tasks.
+
+    Unlike one task per item throttled by a semaphore, only ``workers``
+    coroutines ever exist, each pulling the next item off a shared queue.
+    ``items`` may be an async iterator, in which case processing starts
+    while it is still producing. If a worker raises, the others are
+    cancelled and the error is re-raised (``asyncio.TaskGroup`` semantics,
+    which needs Python 3.11).
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers)
+
+    async def feed() -> None:
+        if isinstance(items, AsyncIterator):
+            async with contextlib.aclosing(items):
+                async for item in items:
+                    await queue.put(item)
+        else:
+            for item in items:
+                await queue.put(item)
+        for _ in range(workers):
+            await queue.put(_DONE)
+
+    async def worker() -> None:
+        while (item := await queue.get()) is not _DONE:
+            await process(item)
+
+    tasks = [asyncio.ensure_future(feed())]
+    tasks += [asyncio.ensure_future(worker()) for _ in range(workers)]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+
+
+class _AdaptiveLimit:
+    """
+    Concurrency limit whose size follows the CDN's throttling.
+
+    Each transfer runs inside :meth:`slot`, like a semaphore. The limit is
+    halved when a transfer fails with a throttling status, and grows back
+    by one after every ``grow_after`` successful transfers, up to
+    ``maximum``. A burst of throttled transfers counts once: only transfers
+    started after the last decrease can lower the limit again. A smaller
+    limit takes effect as in-flight transfers finish; none of them is
+    interrupted.
+    """
+
+    def __init__(self, maximum: int, grow_after: int = 8):
+        self.maximum = maximum
+        self.limit = maximum
+        self._grow_after = grow_after
+        self._active = 0
+        self._successes = 0
+        # Bumped on every decrease, to tell which transfers predate it
+        self._decreases = 0
+        self._cond = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+            started = self._decreases
+        succeeded = throttled = False
+        try:
+            yield
+            succeeded = True
+        except Exception as e:
+            throttled = _is_throttled(e)
+            raise
+        finally:
+            async with self._cond:
+                self._active -= 1
+                if succeeded:
+                    self._successes += 1
+                    if self._successes >= self._grow_after and self.limit < self.maximum:
+                        self.limit += 1
+                        self._successes = 0
+                elif throttled:
+                    self._successes = 0
+                    if started == self._decreases and self.limit > 1:
+                        self.limit //= 2
+                        self._decreases += 1
+                        logger.info(
+                            "CDN is throttling, lowering concurrency to %d", self.limit
+                        )
+                self._cond.notify_all()
+
+
+def _hash_file(digest: hashlib._Hash, path: Path) -> None:
+    with open(path, "rb") as fp:
+        while block := fp.read(DOWNLOAD_CHUNK):
+            digest.update(block)
+
+
+def _has_sha1(path: Path, sha1: Optional[str]) -> bool:
+    """Whether ``path`` hashes to ``sha1``; trusted as-is when it is unknown."""
+    if sha1 is None:
+        return True
+    digest = hashlib.sha1()
+    _hash_file(digest, path)
+    return digest.hexdigest() == sha1
+
+
+def _is_jar(f: CurseManifestFile) -> bool:
+    return bool(f.file_name) and f.file_name.lower().endswith(".jar")  # type: ignore
+
+
+def _is_not_found(error: Optional[Exception]) -> bool:
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code == 404
+    )
+
+
+def _is_throttled(error: BaseException) -> bool:
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code in RETRY_STATUSES
+    )
+
+
+def _download_retry_delay(error: Exception, previous: float) -> float:
+    """
+    Seconds to wait before the next download attempt.
+
+    The CDN's ``Retry-After`` when it throttles, otherwise decorrelated
+    jitter: a random delay between the base and three times the previous
+    one, so downloads that failed together do not all retry together.
+    """
+    if isinstance(error, httpx.HTTPStatusError) and _is_throttled(error):
+        try:
+            retry_after = float(error.response.headers["Retry-After"])
+            return min(retry_after, MAX_RATE_LIMIT_WAIT)
+        except (KeyError, ValueError):
+            pass
+    return min(RETRY_MAX_DELAY, random.uniform(RETRY_BASE_DELAY, previous * 3))
@@ -37,13 +37,14 @@ class CurseManifestFile(BaseModel):
     A single file entry in the modpack manifest.
 
     The manifest normally only contains ``projectID`` and ``fileID``.
-    ``fileName`` and ``url`` are resolved later via the API.
+    ``fileName``, ``url`` and ``sha1`` are resolved later via the API.
     """
 
     project_id: int = Field(alias="projectID")
     file_id: int = Field(alias="fileID")
     file_name: Optional[str] = Field(default=None, alias="fileName")
     url: Optional[str] = None
+    sha1: Optional[str] = None
     required: bool = True
 
     model_config = {"populate_by_name": True}
@@ -152,6 +153,14 @@ class AddonFile(BaseModel):
 
     model_config = {"populate_by_name": True}
 
+    @property
+    def sha1(self) -> Optional[str]:
+        """The SHA-1 hex digest listed in ``hashes``, if any."""
+        for file_hash in self.hashes:
+            if file_hash.algo == 1:
+                return file_hash.value.lower()
+        return None
+
 
 class AddonFileIndex(BaseModel):
     game_version: str = Field(default="", alias="gameVersion")
@@ -20,6 +20,8 @@ from __future__ import annotations
 
 from curseforge_dl.models import AddonFile
 
+CDN_BASE = "https://edge.forgecdn.net"
+
 
 def build_cdn_url(file_id: int, file_name: str) -> str:
     """
@@ -28,7 +30,7 @@ def build_cdn_url(file_id: int, file_name: str) -> str:
     This mirrors the fallback logic in HMCL's ``CurseAddon.LatestFile.getDownloadUrl()``
     and ``CurseManifestFile.getUrl()``.
     """
-    return f"https://edge.forgecdn.net/files/{file_id // 1000}/{file_id % 1000}/{file_name}"
+    return f"{CDN_BASE}/files/{file_id // 1000}/{file_id % 1000}/{file_name}"
 
 
 def get_download_url(addon_file: AddonFile) -> str:
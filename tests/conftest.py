@@ -0,0 +1,26 @@
+"""Shared fixtures for the test suite."""
+
+import httpx
+import pytest
+
+from curseforge_dl.api import CurseForgeAPI
+from curseforge_dl.cache import ApiCache
+
+
+@pytest.fixture
+def make_api(monkeypatch):
+    """
+    Factory for a :class:`CurseForgeAPI` whose requests go to ``handler``
+    through a mocked transport. Without a ``cache`` the on-disk response
+    cache is disabled.
+    """
+
+    async def make(handler, cache: ApiCache | None = None) -> CurseForgeAPI:
+        if cache is None:
+            monkeypatch.setenv("CF_DISABLE_API_CACHING", "1")
+        api = CurseForgeAPI(api_key="key", cache=cache)
+        await api._client.aclose()
+        api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return api
+
+    return make
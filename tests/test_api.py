@@ -0,0 +1,182 @@
+"""Tests for the CurseForge API client (against a mocked transport)."""
+
+import json
+import time
+
+import httpx
+import pytest
+
+from curseforge_dl import api as api_module
+
+
+class TestBulkLookups:
+    @pytest.mark.asyncio
+    async def test_get_files_chunks_ids(self, make_api, monkeypatch):
+        monkeypatch.setattr(api_module, "BULK_CHUNK_SIZE", 2)
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/v1/mods/files"
+            ids = json.loads(request.content)["fileIds"]
+            bodies.append(ids)
+            return httpx.Response(
+                200, json={"data": [{"id": i, "fileName": f"{i}.jar"} for i in ids]}
+            )
+
+        async with await make_api(handler) as api:
+            files = await api.get_files([1, 2, 3, 4, 5])
+
+        assert sorted(bodies) == [[1, 2], [3, 4], [5]]
+        assert sorted(f.id for f in files) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_get_mods(self, make_api):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/v1/mods"
+            ids = json.loads(request.content)["modIds"]
+            return httpx.Response(
+                200, json={"data": [{"id": i, "classId": 6} for i in ids]}
+            )
+
+        async with await make_api(handler) as api:
+            mods = await api.get_mods([10, 20])
+
+        assert {m.id: m.class_id for m in mods} == {10: 6, 20: 6}
+
+    @pytest.mark.asyncio
+    async def test_empty_ids_make_no_request(self, make_api):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("unexpected request")
+
+        async with await make_api(handler) as api:
+            assert await api.get_files([]) == []
+            assert await api.get_mods([]) == []
+
+
+class TestRetry:
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_requests(self, make_api, monkeypatch):
+        monkeypatch.setattr(api_module, "_retry_delay", lambda resp, attempt: 0)
+        statuses = iter([429, 503, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"data": {"id": 1}})
+
+        async with await make_api(handler) as api:
+            mod = await api.get_mod(1)
+        assert mod.id == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, make_api, monkeypatch):
+        monkeypatch.setattr(api_module, "_retry_delay", lambda resp, attempt: 0)
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(429)
+
+        async with await make_api(handler) as api:
+            with pytest.raises(httpx.HTTPStatusError):
+                await api.get_mod(1)
+        assert len(calls) == api_module.MAX_RETRIES
+
+    def test_retry_delay_honors_retry_after(self):
+        resp = httpx.Response(429, headers={"Retry-After": "7"})
+        assert 7 <= api_module._retry_delay(resp, 1) < 8
+        assert 4 <= api_module._retry_delay(httpx.Response(503), 2) < 5
+
+    def test_retry_delay_is_capped(self):
+        resp = httpx.Response(429, headers={"Retry-After": "3600"})
+        assert api_module._retry_delay(resp, 1) == api_module.MAX_RATE_LIMIT_WAIT
+
+
+class TestSearch:
+    @pytest.mark.asyncio
+    async def test_search_mods_validates_raw_page(self, make_api):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/v1/mods/search"
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {
+                            "id": 238222,
+                            "slug": "jei",
+                            "latestFiles": [{"id": 1, "fileName": "jei.jar"}],
+                        }
+                    ],
+                    "pagination": {"index": 0, "pageSize": 1, "totalCount": 1},
+                },
+            )
+
+        async with await make_api(handler) as api:
+            results = await api.search_mods("jei")
+
+        assert [m.slug for m in results] == ["jei"]
+        assert results[0].latest_files[0].file_name == "jei.jar"
+
+    @pytest.mark.asyncio
+    async def test_get_mod_by_slug_requests_one_exact_match(self, make_api):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(dict(request.url.params))
+            return httpx.Response(200, json={"data": [{"id": 1, "slug": "jei-addon"}]})
+
+        async with await make_api(handler) as api:
+            assert await api.get_mod_by_slug("jei") is None
+
+        assert seen[0]["slug"] == "jei"
+        assert seen[0]["pageSize"] == "1"
+
+
+class TestRateLimit:
+    @pytest.mark.asyncio
+    async def test_low_remaining_pauses_client(self, make_api):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"},
+                json={"data": {"id": 1}},
+            )
+
+        async with await make_api(handler) as api:
+            await api.get_mod(1)
+            assert 29 < api._resume_at - time.monotonic() <= 30
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("offset, expected", [(20, 20), (-5, 0)])
+    async def test_epoch_reset(self, make_api, offset: float, expected: float):
+        reset = str(time.time() + offset)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset},
+                json={"data": {"id": 1}},
+            )
+
+        async with await make_api(handler) as api:
+            await api.get_mod(1)
+            assert expected - 1 < api._resume_at - time.monotonic() <= expected
+
+    @pytest.mark.asyncio
+    async def test_plenty_remaining_does_not_pause(self, make_api):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": "30"},
+                json={"data": {"id": 1}},
+            )
+
+        async with await make_api(handler) as api:
+            await api.get_mod(1)
+            assert api._resume_at < time.monotonic()
+
+    @pytest.mark.asyncio
+    async def test_requests_wait_for_resume(self, make_api):
+        async with await make_api(lambda request: None) as api:
+            api._pause(0.05)
+            start = time.monotonic()
+            await api._wait_for_rate_limit()
+            assert time.monotonic() - start >= 0.04
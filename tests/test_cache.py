@@ -0,0 +1,110 @@
+"""Tests for the persistent API response cache."""
+
+import json
+import sqlite3
+
+import httpx
+import pytest
+
+from curseforge_dl.cache import ApiCache
+
+
+class TestApiCache:
+    def test_roundtrip(self, tmp_path):
+        cache = ApiCache(tmp_path / "api.db")
+        assert cache.get("k") is None
+        cache.set("k", b'{"data": 1}')
+        assert cache.get("k") == b'{"data": 1}'
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        cache = ApiCache(tmp_path / "api.db")
+        cache.set("k", b"body")
+        cache.close()
+        assert ApiCache(tmp_path / "api.db").get("k") == b"body"
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = ApiCache(tmp_path / "api.db")
+        cache.set("k", b"body", ttl=-1)
+        assert cache.get("k") is None
+
+    def test_expired_entries_are_purged_on_open(self, tmp_path):
+        cache = ApiCache(tmp_path / "api.db")
+        cache.set("old", b"body", ttl=-1)
+        cache.set("new", b"body", ttl=60)
+        cache.close()
+
+        cache = ApiCache(tmp_path / "api.db")
+        keys = [row[0] for row in cache._connect().execute("SELECT key FROM responses")]
+        assert keys == ["new"]
+
+    def test_database_errors_are_misses(self, tmp_path):
+        cache = ApiCache(tmp_path / "api.db")
+        cache.set("k", b"body")
+        with sqlite3.connect(tmp_path / "api.db") as other:
+            other.execute("DROP TABLE responses")
+        other.close()
+
+        assert cache.get("k") is None
+        cache.set("k", b"body")
+        cache.set_many([("a", b"1")])
+
+    def test_set_many(self, tmp_path):
+        cache = ApiCache(tmp_path / "api.db")
+        cache.set_many([("a", b"1"), ("b", b"2")])
+        assert (cache.get("a"), cache.get("b")) == (b"1", b"2")
+
+    def test_unopenable_path_disables_cache(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = ApiCache(blocker / "api.db")
+        cache.set("k", b"body")
+        assert cache.get("k") is None
+
+
+def _mod_handler(calls: list[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"data": {"id": 238222, "name": "JEI"}})
+
+    return handler
+
+
+class TestCurseForgeAPICaching:
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self, tmp_path, make_api):
+        calls: list[str] = []
+        cache = ApiCache(tmp_path / "api.db")
+        async with await make_api(_mod_handler(calls), cache) as api:
+            first = await api.get_mod(238222)
+            second = await api.get_mod(238222)
+        assert first.name == second.name == "JEI"
+        assert calls == ["/v1/mods/238222"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_env(self, tmp_path, monkeypatch, make_api):
+        monkeypatch.setenv("CF_DISABLE_API_CACHING", "1")
+        calls: list[str] = []
+        cache = ApiCache(tmp_path / "api.db")
+        async with await make_api(_mod_handler(calls), cache) as api:
+            await api.get_mod(238222)
+            await api.get_mod(238222)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookups_cached_per_item(self, tmp_path, make_api):
+        requested: list[list[int]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ids = json.loads(request.content)["fileIds"]
+            requested.append(ids)
+            return httpx.Response(
+                200, json={"data": [{"id": i, "fileName": f"{i}.jar"} for i in ids]}
+            )
+
+        async with await make_api(handler, ApiCache(tmp_path / "api.db")) as api:
+            await api.get_files([1, 2])
+            files = await api.get_files([1, 2, 3])
+
+        assert requested == [[1, 2], [3]]
+        assert sorted(f.file_name for f in files) == ["1.jar", "2.jar", "3.jar"]
@@ -1,9 +1,19 @@
 """Tests for MurmurHash2 fingerprint computation."""
 
+import os
+
+import pytest
+
 from curseforge_dl.fingerprint import (
+    MMAP_THRESHOLD,
+    _fingerprint_c,
+    _murmur2_c,
     _murmur_hash2,
+    _murmur_hash2_py,
     _strip_whitespace,
+    curseforge_fingerprint,
     curseforge_fingerprint_bytes,
+    curseforge_fingerprint_many,
 )
 
 
@@ -31,6 +41,35 @@ class TestMurmurHash2:
         assert r1 != r2
 
 
+@pytest.mark.skipif(_murmur2_c is None, reason="C extension not built")
+class TestNativeMurmurHash2:
+    def test_matches_python_tail_lengths(self):
+        # Cover every tail length (0-3 leftover bytes)
+        for n in range(0, 16):
+            data = bytes(range(n))
+            assert _murmur2_c(data) == _murmur_hash2_py(data, seed=1)
+
+    def test_matches_python_random(self):
+        data = os.urandom(64 * 1024 + 3)
+        assert _murmur2_c(data) == _murmur_hash2_py(data, seed=1)
+
+    def test_matches_python_seeds(self):
+        data = b"test data"
+        for seed in (0, 1, 42, 0xFFFFFFFF):
+            assert _murmur2_c(data, seed) == _murmur_hash2_py(data, seed=seed)
+
+    def test_fused_fingerprint_matches_python(self):
+        # Whitespace-heavy and whitespace-free blocks, odd total length
+        data = b"a b\tc\r\nd" * 1000 + os.urandom(4099) + b"  \n"
+        expected = _murmur_hash2_py(_strip_whitespace(data), seed=1)
+        assert _fingerprint_c(data) == expected
+
+    def test_fused_fingerprint_all_whitespace(self):
+        for n in range(0, 20):
+            data = b"\t\n\r " * n
+            assert _fingerprint_c(data[:n]) == _murmur_hash2_py(b"", seed=1)
+
+
 class TestStripWhitespace:
     def test_strip(self):
         # 0x09=tab, 0x0a=newline, 0x0d=CR, 0x20=space
@@ -65,3 +104,32 @@ class TestCurseforgeFingerprint:
         # After stripping whitespace, these should all be:
         # b"publicclassMyMod{}"
         assert fp1 == fp2 == fp3
+
+    @pytest.mark.parametrize("extra", [1001, MMAP_THRESHOLD])
+    def test_file_matches_bytes(self, tmp_path, extra):
+        # Small files are read, large ones memory-mapped
+        data = b"public class MyMod {\n}\n" * 100 + os.urandom(extra)
+        path = tmp_path / "mod.jar"
+        path.write_bytes(data)
+        assert curseforge_fingerprint(path) == curseforge_fingerprint_bytes(data)
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.jar"
+        path.write_bytes(b"")
+        assert curseforge_fingerprint(path) == curseforge_fingerprint_bytes(b"")
+
+
+class TestCurseforgeFingerprintMany:
+    @pytest.mark.asyncio
+    async def test_preserves_order(self, tmp_path):
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"mod{i}.jar"
+            path.write_bytes(os.urandom(1000 + i))
+            paths.append(path)
+        expected = [curseforge_fingerprint(p) for p in paths]
+        assert await curseforge_fingerprint_many(paths) == expected
+
+    @pytest.mark.asyncio
+    async def test_empty(self):
+        assert await curseforge_fingerprint_many([]) == []
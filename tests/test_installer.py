@@ -0,0 +1,646 @@
+"""Tests for the modpack installer (with a fake API client)."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import zipfile
+from pathlib import Path
+
+import httpx
+import pytest
+
+from curseforge_dl.installer import (
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    ModpackInstaller,
+    _AdaptiveLimit,
+    _download_retry_delay,
+    _run_workers,
+)
+from curseforge_dl.models import (
+    AddonFile,
+    CurseAddon,
+    CurseManifestFile,
+    SECTION_MOD,
+    SECTION_RESOURCE_PACK,
+    SECTION_SHADER_PACK,
+)
+
+
+class FakeAPI:
+    """Serves bulk lookups from in-memory tables and records the calls."""
+
+    def __init__(
+        self,
+        files: list[AddonFile],
+        mods: list[CurseAddon],
+        download_urls: dict[int, str] | None = None,
+        single_files: list[AddonFile] = (),
+    ):
+        self.files = {f.id: f for f in files}
+        self.mods = {m.id: m for m in mods}
+        self.download_urls = download_urls or {}
+        # Only visible to single-file lookups, not to the bulk endpoint
+        self.single_files = {f.id: f for f in single_files}
+        # Raised by single-file lookups of these IDs
+        self.lookup_errors: dict[int, Exception] = {}
+        self.calls: list[tuple[str, list[int]]] = []
+
+    async def get_files(self, file_ids: list[int]) -> list[AddonFile]:
+        self.calls.append(("get_files", list(file_ids)))
+        return [self.files[i] for i in file_ids if i in self.files]
+
+    async def get_mods(self, mod_ids: list[int]) -> list[CurseAddon]:
+        self.calls.append(("get_mods", list(mod_ids)))
+        return [self.mods[i] for i in mod_ids if i in self.mods]
+
+    async def get_mod_file(self, mod_id: int, file_id: int) -> AddonFile:
+        self.calls.append(("get_mod_file", [file_id]))
+        if file_id in self.lookup_errors:
+            raise self.lookup_errors[file_id]
+        if file_id not in self.single_files:
+            raise _status_error(404)
+        return self.single_files[file_id]
+
+    async def get_mod_file_download_url(self, mod_id: int, file_id: int) -> str:
+        self.calls.append(("get_mod_file_download_url", [file_id]))
+        return self.download_urls[file_id]
+
+
+def _write_pack(zip_path: Path, files: list[dict]) -> None:
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("manifest.json", json.dumps({"name": "Pack", "files": files}))
+        zf.writestr("overrides/config/a.toml", "x = 1")
+
+
+class TestInstall:
+    @pytest.mark.asyncio
+    async def test_installs_pack(self, tmp_path: Path):
+        zip_path = tmp_path / "pack.zip"
+        _write_pack(
+            zip_path,
+            [{"projectID": 1, "fileID": 10}, {"projectID": 2, "fileID": 20}],
+        )
+        api = FakeAPI(
+            files=[
+                AddonFile(
+                    id=10,
+                    modId=1,
+                    fileName="a.jar",
+                    hashes=[{"value": hashlib.sha1(b"a.jar").hexdigest(), "algo": 1}],
+                ),
+                AddonFile(id=20, modId=2, fileName="b.zip"),
+            ],
+            mods=[CurseAddon(id=2, classId=SECTION_RESOURCE_PACK)],
+        )
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.method)
+            return httpx.Response(200, content=request.url.path.rsplit("/", 1)[1].encode())
+
+        out = tmp_path / "out"
+        async with ModpackInstaller(api, concurrency=2) as installer:
+            installer._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            manifest = await installer.install(zip_path, out)
+
+        assert (out / "config" / "a.toml").read_text() == "x = 1"
+        assert (out / "mods" / "a.jar").read_bytes() == b"a.jar"
+        assert (out / "resourcepacks" / "b.zip").read_bytes() == b"b.zip"
+        assert [f.file_name for f in manifest.files] == ["a.jar", "b.zip"]
+        written = json.loads((out / "manifest.json").read_text())
+        assert written["files"][1]["url"] == "https://edge.forgecdn.net/files/0/20/b.zip"
+        assert all("sha1" not in f for f in written["files"])
+        assert requests.count("HEAD") <= 2
+        assert requests.count("GET") == 2
+
+    @pytest.mark.asyncio
+    async def test_closes_client_without_async_with(self, tmp_path: Path):
+        zip_path = tmp_path / "pack.zip"
+        _write_pack(zip_path, [])
+        installer = ModpackInstaller(FakeAPI(files=[], mods=[]), concurrency=1)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        installer._client = client
+
+        await installer.install(zip_path, tmp_path / "out")
+
+        # Nothing to download, so no CDN warm-up either
+        assert requests == []
+        assert client.is_closed
+        assert installer._client is None
+
+    @pytest.mark.asyncio
+    async def test_slow_warm_up_does_not_hold_back_downloads(self, tmp_path: Path):
+        zip_path = tmp_path / "pack.zip"
+        _write_pack(zip_path, [{"projectID": 1, "fileID": 10}])
+        api = FakeAPI(files=[AddonFile(id=10, modId=1, fileName="a.jar")], mods=[])
+        never = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "HEAD":
+                await never.wait()
+            return httpx.Response(200, content=b"jar")
+
+        async with ModpackInstaller(api, concurrency=1) as installer:
+            installer._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            await asyncio.wait_for(installer.install(zip_path, tmp_path / "out"), 5)
+
+        assert (tmp_path / "out" / "mods" / "a.jar").read_bytes() == b"jar"
+
+    @pytest.mark.asyncio
+    async def test_extraction_failure_cancels_background_tasks(self, tmp_path: Path):
+        zip_path = tmp_path / "pack.zip"
+        _write_pack(zip_path, [{"projectID": 1, "fileID": 10}])
+        api = FakeAPI(files=[], mods=[])
+        never = asyncio.Event()
+        cancelled = []
+
+        async def stalled_lookup(file_ids: list[int]) -> list[AddonFile]:
+            try:
+                await never.wait()
+            except asyncio.CancelledError:
+                cancelled.append("resolve")
+                raise
+
+        async def stalled_head(request: httpx.Request) -> httpx.Response:
+            try:
+                await never.wait()
+            except asyncio.CancelledError:
+                cancelled.append("warm-up")
+                raise
+
+        def broken_extract(*args) -> int:
+            raise OSError("disk full")
+
+        api.get_files = stalled_lookup
+        async with ModpackInstaller(api, concurrency=1) as installer:
+            installer._client = httpx.AsyncClient(transport=httpx.MockTransport(stalled_head))
+            installer._extract_overrides = broken_extract
+            with pytest.raises(OSError, match="disk full"):
+                await installer.install(zip_path, tmp_path / "out")
+
+        assert sorted(cancelled) == ["resolve", "warm-up"]
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+class TestParseManifest:
+    def test_finds_nested_manifest(self, tmp_path: Path):
+        zip_path = tmp_path / "pack.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("overrides/config/a.toml", "x")
+            zf.writestr(
+                "Pack/manifest.json",
+                json.dumps({"name": "Pack", "files": [{"projectID": 1, "fileID": 10}]}),
+            )
+        manifest = ModpackInstaller.parse_modpack_info(zip_path)
+        assert manifest.name == "Pack"
+        assert [f.file_id for f in manifest.files] == [10]
+
+    def test_missing_manifest(self, tmp_path: Path):
+        zip_path = tmp_path / "pack.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("readme.txt", "x")
+        with pytest.raises(FileNotFoundError):
+            ModpackInstaller.parse_modpack_info(zip_path)
+
+
+class TestSelectLatestFile:
+    def test_picks_newest_client_file(self):
+        addon = CurseAddon(
+            id=1,
+            latestFiles=[
+                {"id": 1, "fileName": "old.zip", "fileDate": "2024-01-01T00:00:00Z"},
+                {"id": 2, "fileName": "server.zip", "fileDate": "2024-03-01T00:00:00Z",
+                 "isServerPack": True},
+                {"id": 3, "fileName": "new.zip", "fileDate": "2024-02-01T00:00:00Z",
+                 "gameVersions": ["1.20.1"]},
+            ],
+        )
+        assert ModpackInstaller._select_latest_file(addon).id == 3
+        assert ModpackInstaller._select_latest_file(addon, "1.20.1").id == 3
+        assert ModpackInstaller._select_latest_file(CurseAddon(id=1)) is None
+
+
+class TestExtractOverrides:
+    def test_extracts_only_overrides(self, tmp_path: Path):
+        zip_path = tmp_path / "pack.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("manifest.json", "{}")
+            zf.writestr("overrides/", "")
+            for i in range(20):
+                zf.writestr(f"overrides/config/{i % 3}/f{i}.toml", f"value = {i}\n" * 100)
+        out = tmp_path / "out"
+
+        with zipfile.ZipFile(zip_path) as zf:
+            count = ModpackInstaller._extract_overrides(zf, out, "overrides")
+            # Workers opened and closed entries concurrently; the shared
+            # handle must still be open with no entry references left
+            assert zf._fileRefCnt == 1
+            assert zf.read("manifest.json") == b"{}"
+
+        assert count == 20
+        assert (out / "config" / "1" / "f7.toml").read_text() == "value = 7\n" * 100
+        assert not (out / "manifest.json").exists()
+
+
+class TestResolveFiles:
+    @pytest.mark.asyncio
+    async def test_bulk_resolves_and_keeps_missing(self):
+        api = FakeAPI(
+            files=[
+                AddonFile(
+                    id=100,
+                    modId=1,
+                    fileName="a.jar",
+                    downloadUrl="https://x/a.jar",
+                    hashes=[{"value": "cd34", "algo": 2}, {"value": "AB12", "algo": 1}],
+                ),
+                AddonFile(id=200, modId=2, fileName="b.jar", downloadUrl=None),
+            ],
+            mods=[],
+        )
+        manifest_files = [
+            CurseManifestFile(projectID=1, fileID=100),
+            CurseManifestFile(projectID=2, fileID=200, required=False),
+            CurseManifestFile(projectID=3, fileID=300),
+        ]
+        resolved = await ModpackInstaller(api)._resolve_files(manifest_files)
+
+        assert api.calls == [("get_files", [100, 200, 300]), ("get_mod_file", [300])]
+        assert [f.file_id for f in resolved] == [100, 200, 300]
+        assert resolved[0].url == "https://x/a.jar"
+        assert resolved[0].sha1 == "ab12"
+        assert resolved[1].url == "https://edge.forgecdn.net/files/0/200/b.jar"
+        assert resolved[1].required is False
+        assert resolved[2].file_name is None
+
+    @pytest.mark.asyncio
+    async def test_single_lookup_for_ids_missing_from_bulk(self):
+        api = FakeAPI(
+            files=[],
+            mods=[],
+            single_files=[AddonFile(id=100, modId=1, fileName="a.jar")],
+        )
+        resolved = await ModpackInstaller(api)._resolve_files(
+            [CurseManifestFile(projectID=1, fileID=100)]
+        )
+        assert api.calls == [("get_files", [100]), ("get_mod_file", [100])]
+        assert resolved[0].file_name == "a.jar"
+
+    @pytest.mark.asyncio
+    async def test_failed_bulk_lookup_falls_back_to_single_lookups(self):
+        api = FakeAPI(
+            files=[],
+            mods=[],
+            single_files=[
+                AddonFile(id=100, modId=1, fileName="a.jar"),
+                AddonFile(id=200, modId=2, fileName="b.jar"),
+            ],
+        )
+
+        async def failing_bulk(file_ids: list[int]) -> list[AddonFile]:
+            api.calls.append(("get_files", list(file_ids)))
+            raise httpx.ConnectTimeout("timed out")
+
+        api.get_files = failing_bulk
+        resolved = await ModpackInstaller(api, concurrency=1)._resolve_files(
+            [CurseManifestFile(projectID=1, fileID=100), CurseManifestFile(projectID=2, fileID=200)]
+        )
+
+        assert api.calls == [
+            ("get_files", [100, 200]),
+            ("get_mod_file", [100]),
+            ("get_mod_file", [200]),
+        ]
+        assert [f.file_name for f in resolved] == ["a.jar", "b.jar"]
+
+    @pytest.mark.asyncio
+    async def test_single_lookup_errors_are_not_reported_as_deleted(self, caplog):
+        api = FakeAPI(files=[], mods=[])
+        api.lookup_errors[200] = _status_error(500)
+        with caplog.at_level(logging.WARNING):
+            resolved = await ModpackInstaller(api)._resolve_files(
+                [CurseManifestFile(projectID=1, fileID=100), CurseManifestFile(projectID=2, fileID=200)]
+            )
+
+        assert [f.file_name for f in resolved] == [None, None]
+        messages = [(r.levelname, r.getMessage()) for r in caplog.records]
+        assert ("WARNING", "File not found: project=1 file=100 (deleted?)") in messages
+        assert not any("file=200 (deleted?)" in m for _, m in messages)
+        assert any(level == "ERROR" and "project=2 file=200" in m for level, m in messages)
+
+    @pytest.mark.asyncio
+    async def test_already_resolved_entries_skip_api(self):
+        api = FakeAPI(files=[], mods=[])
+        f = CurseManifestFile(projectID=1, fileID=100, fileName="a.jar", url="https://x/a.jar")
+        resolved = await ModpackInstaller(api)._resolve_files([f])
+        assert resolved == [f]
+        assert api.calls == []
+
+
+class TestIterFileTargets:
+    @pytest.mark.asyncio
+    async def test_maps_class_ids_to_subdirs(self, tmp_path: Path):
+        api = FakeAPI(
+            files=[],
+            mods=[
+                CurseAddon(id=1, classId=SECTION_MOD),
+                CurseAddon(id=2, classId=SECTION_RESOURCE_PACK),
+                CurseAddon(id=3, classId=SECTION_SHADER_PACK),
+            ],
+        )
+        files = [
+            CurseManifestFile(projectID=1, fileID=10, fileName="a.jar", url="u"),
+            CurseManifestFile(projectID=2, fileID=20, fileName="b.zip", url="u"),
+            CurseManifestFile(projectID=3, fileID=30, fileName="c.zip", url="u"),
+            CurseManifestFile(projectID=4, fileID=40, fileName="d.jar", url="u"),
+        ]
+        installer = ModpackInstaller(api)
+        targets = [pair async for pair in installer._iter_file_targets(files, tmp_path)]
+
+        # .jar files come first, without waiting for the classId lookup
+        assert [t.relative_to(tmp_path).as_posix() for _, t in targets] == [
+            "mods/a.jar",
+            "mods/d.jar",
+            "resourcepacks/b.zip",
+            "shaderpacks/c.zip",
+        ]
+        assert all(t.parent.is_dir() for _, t in targets)
+        # .jar files are always mods, so only the .zip projects are looked up
+        assert api.calls == [("get_mods", [2, 3])]
+
+
+class TestDownloadFiles:
+    @pytest.mark.asyncio
+    async def test_falls_back_to_api_url_when_cdn_url_is_missing(self, tmp_path: Path):
+        api = FakeAPI(
+            files=[],
+            mods=[CurseAddon(id=1, classId=SECTION_MOD)],
+            download_urls={10: "https://api/a.jar"},
+        )
+        installer = ModpackInstaller(api)
+        fetched = []
+
+        async def fake_download(url: str, target: Path, **kwargs) -> None:
+            fetched.append(url)
+            if url.startswith("https://edge.forgecdn.net/"):
+                request = httpx.Request("GET", url)
+                raise httpx.HTTPStatusError(
+                    "404", request=request, response=httpx.Response(404, request=request)
+                )
+            target.write_bytes(b"jar")
+
+        installer._download_file = fake_download
+        f = CurseManifestFile(
+            projectID=1,
+            fileID=10,
+            fileName="a.jar",
+            url="https://edge.forgecdn.net/files/0/10/a.jar",
+        )
+        await installer._download_files([f], tmp_path)
+
+        assert fetched == ["https://edge.forgecdn.net/files/0/10/a.jar", "https://api/a.jar"]
+        assert (tmp_path / "mods" / "a.jar").read_bytes() == b"jar"
+        assert f.url == "https://api/a.jar"
+
+    @pytest.mark.asyncio
+    async def test_downloads_share_one_client(self, tmp_path: Path):
+        clients = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=request.url.path.encode())
+
+        async with ModpackInstaller(FakeAPI(files=[], mods=[])) as installer:
+            installer._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            for name in ("a.jar", "b.jar"):
+                await installer._download_file(f"https://cdn/{name}", tmp_path / name)
+                clients.append(installer._download_client())
+
+        assert clients[0] is clients[1]
+        assert (tmp_path / "b.jar").read_bytes() == b"/b.jar"
+        assert installer._client is None
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_cdn_connections(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, request.url.host))
+            return httpx.Response(200)
+
+        async with ModpackInstaller(FakeAPI(files=[], mods=[])) as installer:
+            installer._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            await installer._warm_up_cdn(3)
+
+        assert requests == [("HEAD", "edge.forgecdn.net")] * 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("honor_range", [True, False])
+    async def test_resumes_partial_download(self, tmp_path: Path, honor_range: bool):
+        body = b"0123456789"
+        target = tmp_path / "a.jar"
+        (tmp_path / "a.jar.part").write_bytes(body[:4])
+        ranges = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ranges.append(request.headers.get("Range"))
+            if honor_range:
+                return httpx.Response(206, content=body[4:])
+            return httpx.Response(200, content=body)
+
+        async with ModpackInstaller(FakeAPI(files=[], mods=[])) as installer:
+            installer._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            await installer._download_file("https://cdn/a.jar", target)
+
+        assert ranges == ["bytes=4-"]
+        assert target.read_bytes() == body
+        assert not (tmp_path / "a.jar.part").exists()
+
+    @pytest.mark.asyncio
+    async def test_sha1_mismatch_discards_download(self, tmp_path: Path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"corrupt")
+
+        target = tmp_path / "a.jar"
+        async with ModpackInstaller(FakeAPI(files=[], mods=[])) as installer:
+            installer._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with pytest.raises(ValueError, match="SHA-1 mismatch"):
+                await installer._download_file(
+                    "https://cdn/a.jar", target, sha1=hashlib.sha1(b"jar").hexdigest()
+                )
+            await installer._download_file(
+                "https://cdn/a.jar", target, sha1=hashlib.sha1(b"corrupt").hexdigest()
+            )
+
+        assert target.read_bytes() == b"corrupt"
+        assert not (tmp_path / "a.jar.part").exists()
+
+    @pytest.mark.asyncio
+    async def test_existing_files_are_kept_only_if_their_sha1_matches(self, tmp_path: Path):
+        api = FakeAPI(files=[], mods=[])
+        installer = ModpackInstaller(api)
+        fetched = []
+
+        async def fake_download(url: str, target: Path, **kwargs) -> None:
+            fetched.append(url)
+            target.write_bytes(b"jar")
+
+        installer._download_file = fake_download
+        mods = tmp_path / "mods"
+        mods.mkdir()
+        (mods / "good.jar").write_bytes(b"jar")
+        (mods / "bad.jar").write_bytes(b"truncated")
+        files = [
+            CurseManifestFile(
+                projectID=1,
+                fileID=i,
+                fileName=name,
+                url=f"https://cdn/{name}",
+                sha1=hashlib.sha1(b"jar").hexdigest(),
+            )
+            for i, name in enumerate(("good.jar", "bad.jar"))
+        ]
+        await installer._download_files(files, tmp_path)
+
+        assert fetched == ["https://cdn/bad.jar"]
+        assert (mods / "bad.jar").read_bytes() == b"jar"
+
+
+class TestRunWorkers:
+    @pytest.mark.asyncio
+    async def test_processes_all_items_with_bounded_concurrency(self):
+        running = peak = 0
+        done = []
+
+        async def process(item: int) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            done.append(item)
+
+        await _run_workers(list(range(10)), process, 3)
+        assert sorted(done) == list(range(10))
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_other_workers(self):
+        started = []
+
+        async def process(item: int) -> None:
+            started.append(item)
+            if item == 0:
+                raise RuntimeError("boom")
+            await asyncio.sleep(10)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await asyncio.wait_for(_run_workers(list(range(10)), process, 2), 5)
+        assert sorted(started) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_consumes_async_iterator_while_it_produces(self):
+        gate = asyncio.Event()
+        done = []
+
+        async def produce():
+            yield 0
+            await gate.wait()
+            yield 1
+
+        async def process(item: int) -> None:
+            done.append(item)
+            gate.set()
+
+        await _run_workers(produce(), process, 2)
+        assert done == [0, 1]
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://edge.forgecdn.net/files/1/2/a.jar")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+class TestAdaptiveLimit:
+    @pytest.mark.asyncio
+    async def test_throttling_halves_limit_and_successes_restore_it(self):
+        limit = _AdaptiveLimit(8, grow_after=2)
+        with pytest.raises(httpx.HTTPStatusError):
+            async with limit.slot():
+                raise _status_error(429)
+        assert limit.limit == 4
+
+        # Other errors leave the limit alone
+        with pytest.raises(httpx.HTTPStatusError):
+            async with limit.slot():
+                raise _status_error(404)
+        assert limit.limit == 4
+
+        for _ in range(8):
+            async with limit.slot():
+                pass
+        assert limit.limit == 8
+        async with limit.slot():
+            pass
+        assert limit.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_throttled_burst_halves_limit_once(self):
+        limit = _AdaptiveLimit(16)
+        release = asyncio.Event()
+
+        async def throttled_transfer() -> None:
+            async with limit.slot():
+                await release.wait()
+                raise _status_error(429)
+
+        tasks = [asyncio.ensure_future(throttled_transfer()) for _ in range(16)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert limit.limit == 8
+
+        # A transfer started after the decrease can lower it again
+        with pytest.raises(httpx.HTTPStatusError):
+            async with limit.slot():
+                raise _status_error(429)
+        assert limit.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_waits_while_limit_is_reached(self):
+        limit = _AdaptiveLimit(2)
+        limit.limit = 1
+        running = peak = 0
+
+        async def transfer() -> None:
+            nonlocal running, peak
+            async with limit.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0)
+                running -= 1
+
+        await asyncio.gather(*(transfer() for _ in range(5)))
+        assert peak == 1
+
+
+class TestRetryDelay:
+    def test_jitter_stays_within_bounds(self):
+        wait = RETRY_BASE_DELAY
+        for _ in range(50):
+            previous, wait = wait, _download_retry_delay(RuntimeError("boom"), wait)
+            assert RETRY_BASE_DELAY <= wait <= min(RETRY_MAX_DELAY, previous * 3)
+
+    def test_honors_retry_after_when_throttled(self):
+        error = _status_error(429)
+        error.response.headers["Retry-After"] = "7"
+        assert _download_retry_delay(error, RETRY_BASE_DELAY) == 7
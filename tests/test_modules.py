@@ -0,0 +1,22 @@
+"""Static checks over the package source."""
+
+import ast
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+import curseforge_dl
+
+MODULES = sorted(Path(curseforge_dl.__file__).parent.glob("*.py"))
+
+
+@pytest.mark.parametrize("path", MODULES, ids=lambda p: p.name)
+def test_no_duplicate_top_level_definitions(path: Path):
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    names = Counter(
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+    )
+    assert [name for name, n in names.items() if n > 1] == []
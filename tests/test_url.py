@@ -1,52 +1,46 @@
 """Tests for CDN URL construction."""
 
+import pytest
+
 from curseforge_dl.url import build_cdn_url, get_download_url
 from curseforge_dl.models import AddonFile
 
 
 class TestBuildCdnUrl:
-    def test_basic(self):
-        url = build_cdn_url(5433036, "somefile.jar")
-        assert url == "https://edge.forgecdn.net/files/5433/36/somefile.jar"
-
-    def test_round_file_id(self):
-        url = build_cdn_url(4000000, "mod.jar")
-        assert url == "https://edge.forgecdn.net/files/4000/0/mod.jar"
-
-    def test_small_file_id(self):
-        url = build_cdn_url(1234, "test.jar")
-        assert url == "https://edge.forgecdn.net/files/1/234/test.jar"
-
-    def test_large_file_id(self):
-        url = build_cdn_url(7417441, "jei-1.21.1-19.19.2.jar")
-        assert url == "https://edge.forgecdn.net/files/7417/441/jei-1.21.1-19.19.2.jar"
-
-    def test_file_name_with_spaces(self):
-        url = build_cdn_url(1234567, "My Mod File.jar")
-        assert url == "https://edge.forgecdn.net/files/1234/567/My Mod File.jar"
+    @pytest.mark.parametrize(
+        "file_id, file_name, expected",
+        [
+            (5433036, "somefile.jar", "https://edge.forgecdn.net/files/5433/36/somefile.jar"),
+            (4000000, "mod.jar", "https://edge.forgecdn.net/files/4000/0/mod.jar"),
+            (1234, "test.jar", "https://edge.forgecdn.net/files/1/234/test.jar"),
+            (
+                7417441,
+                "jei-1.21.1-19.19.2.jar",
+                "https://edge.forgecdn.net/files/7417/441/jei-1.21.1-19.19.2.jar",
+            ),
+            (1234567, "My Mod File.jar", "https://edge.forgecdn.net/files/1234/567/My Mod File.jar"),
+        ],
+        ids=["basic", "round_file_id", "small_file_id", "large_file_id", "file_name_with_spaces"],
+    )
+    def test_build_cdn_url(self, file_id: int, file_name: str, expected: str):
+        assert build_cdn_url(file_id, file_name) == expected
+
+
+# Built once at import; get_download_url only reads them
+WITH_URL = AddonFile(id=123, fileName="test.jar", downloadUrl="https://example.com/test.jar")
+WITHOUT_URL = AddonFile(id=5433036, fileName="somefile.jar", downloadUrl=None)
+EMPTY_URL = AddonFile(id=5433036, fileName="somefile.jar", downloadUrl="")
 
 
 class TestGetDownloadUrl:
-    def test_with_download_url(self):
-        f = AddonFile(
-            id=123,
-            fileName="test.jar",
-            downloadUrl="https://example.com/test.jar",
-        )
-        assert get_download_url(f) == "https://example.com/test.jar"
-
-    def test_without_download_url(self):
-        f = AddonFile(
-            id=5433036,
-            fileName="somefile.jar",
-            downloadUrl=None,
-        )
-        assert get_download_url(f) == "https://edge.forgecdn.net/files/5433/36/somefile.jar"
-
-    def test_empty_download_url(self):
-        f = AddonFile(
-            id=5433036,
-            fileName="somefile.jar",
-            downloadUrl="",
-        )
-        assert get_download_url(f) == "https://edge.forgecdn.net/files/5433/36/somefile.jar"
+    @pytest.mark.parametrize(
+        "addon_file, expected",
+        [
+            (WITH_URL, "https://example.com/test.jar"),
+            (WITHOUT_URL, "https://edge.forgecdn.net/files/5433/36/somefile.jar"),
+            (EMPTY_URL, "https://edge.forgecdn.net/files/5433/36/somefile.jar"),
+        ],
+        ids=["with_download_url", "without_download_url", "empty_download_url"],
+    )
+    def test_get_download_url(self, addon_file: AddonFile, expected: str):
+        assert get_download_url(addon_file) == expected